@@ -2,36 +2,76 @@
 
 import sys
 from argparse import ArgumentParser, Namespace
-from logging.handlers import SysLogHandler
-from typing import Optional
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Optional
 
-from loguru import logger
-from oresat_configs import Mission, OreSatConfig
-
-from ._internals.app import App, app
-from ._internals.rest_api import RestAPI, render_olaf_template, rest_api
-from ._internals.services.logs import logger_tmp_file_setup
-from ._internals.updater import Updater, UpdaterState
 from .board.adc import Adc
 from .board.cpufreq import A8_CPUFREQS, get_cpufreq, get_cpufreq_gov, set_cpufreq, set_cpufreq_gov
 from .board.eeprom import Eeprom
 from .board.gpio import GPIO_HIGH, GPIO_IN, GPIO_LOW, GPIO_OUT, Gpio, GpioError
 from .board.pru import Pru, PruError, PruState
 from .canopen.ecss import scet_int_from_time, scet_int_to_time, utc_int_from_time, utc_int_to_time
-from .canopen.master_node import MasterNode
-from .canopen.network import CanNetwork, CanNetworkError, CanNetworkState, NetworkError
-from .canopen.node import Node, NodeStop
 from .common.daemon import Daemon, DaemonState
 from .common.oresat_file import OreSatFile, new_oresat_file
 from .common.oresat_file_cache import OreSatFileCache
-from .common.resource import Resource
-from .common.service import Service, ServiceState
 
 try:
     from ._version import version as __version__  # type: ignore
 except ImportError:
     __version__ = "0.0.0"  # package is not installed
 
+if TYPE_CHECKING:
+    # the lazy attributes below, so static tools (pylint, mypy) can see them
+    from loguru import logger
+
+    from ._internals.app import App, app
+    from ._internals.rest_api import RestAPI, render_olaf_template, rest_api
+    from ._internals.services.logs import logger_tmp_file_setup
+    from ._internals.updater import Updater, UpdaterState
+    from .canopen.master_node import MasterNode
+    from .canopen.network import CanNetwork, CanNetworkError, CanNetworkState, NetworkError
+    from .canopen.node import Node, NodeStop
+    from .common.resource import Resource
+    from .common.service import Service, ServiceState
+
+# attributes that pull in canopen, flask, psutil, etc are only imported on first access
+_LAZY_ATTRS = {
+    "App": "._internals.app",
+    "app": "._internals.app",
+    "RestAPI": "._internals.rest_api",
+    "render_olaf_template": "._internals.rest_api",
+    "rest_api": "._internals.rest_api",
+    "logger_tmp_file_setup": "._internals.services.logs",
+    "Updater": "._internals.updater",
+    "UpdaterState": "._internals.updater",
+    "MasterNode": ".canopen.master_node",
+    "CanNetwork": ".canopen.network",
+    "CanNetworkError": ".canopen.network",
+    "CanNetworkState": ".canopen.network",
+    "NetworkError": ".canopen.network",
+    "Node": ".canopen.node",
+    "NodeStop": ".canopen.node",
+    "Resource": ".common.resource",
+    "Service": ".common.service",
+    "ServiceState": ".common.service",
+    "logger": "loguru",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_LAZY_ATTRS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # cache it, so __getattr__ is not called again
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
+
 olaf_parser = ArgumentParser(prog="OLAF", add_help=False)
 olaf_parser.add_argument("-b", "--bus", default="vcan0", help="CAN bus to use, defaults to vcan0")
 olaf_parser.add_argument("-v", "--verbose", action="store_true", help="enable verbose logging")
@@ -99,6 +139,18 @@ def olaf_setup(name: str, args: Optional[Namespace] = None) -> tuple[Namespace,
         The OreSat configs.
     """
 
+    # pylint: disable=C0415
+    # re-imported here on purpose, these shadow the TYPE_CHECKING imports of the lazy attributes
+    from logging.handlers import SysLogHandler
+
+    from loguru import logger  # noqa: W0404
+    from oresat_configs import Mission, OreSatConfig
+
+    from ._internals.app import app  # noqa: W0404
+    from ._internals.rest_api import rest_api  # noqa: W0404
+    from ._internals.services.logs import logger_tmp_file_setup  # noqa: W0404
+    from .canopen.network import CanNetwork  # noqa: W0404
+
     if args is None:
         parser = ArgumentParser(parents=[olaf_parser])
         args = parser.parse_args()
@@ -155,6 +207,9 @@ def olaf_setup(name: str, args: Optional[Namespace] = None) -> tuple[Namespace,
 def olaf_run():
     """Start the app and REST API."""
 
+    from ._internals.app import app  # noqa: W0404 pylint: disable=C0415
+    from ._internals.rest_api import rest_api  # noqa: W0404 pylint: disable=C0415
+
     rest_api.start()
     app.run()
     rest_api.stop()
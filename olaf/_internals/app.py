@@ -1,26 +1,20 @@
 """OLAF App."""
 
-import os
 import signal
 import subprocess
-from typing import Union
+from typing import TYPE_CHECKING, Union
 
-import canopen
 from loguru import logger
 
-from ..canopen.master_node import MasterNode
-from ..canopen.network import CanNetwork
-from ..canopen.node import Node, NodeStop
-from ..common.resource import Resource
-from ..common.service import Service
-from .resources.ecss import EcssResource
-from .resources.fread import FreadResource
-from .resources.fwrite import FwriteResource
-from .resources.system import SystemResource
-from .services.logs import LogsService
-from .services.os_command import OsCommandService
-from .services.updater import UpdaterService
-from .updater import Updater
+from ..common import IS_ROOT
+
+if TYPE_CHECKING:
+    import canopen
+
+    from ..canopen.network import CanNetwork
+    from ..canopen.node import Node
+    from ..common.resource import Resource
+    from ..common.service import Service
 
 
 class App:
@@ -44,13 +38,14 @@ class App:
     def _quit(self, signo, _frame):
         """Called when signals are caught"""
 
-        logger.debug(f"signal {signal.Signals(signo).name} was caught")
+        # lazy, so the signal name is only looked up if debug logging is enabled
+        logger.opt(lazy=True).debug("signal {} was caught", lambda: signal.Signals(signo).name)
         self.stop()
 
     def setup(
         self,
-        network: CanNetwork,
-        od: canopen.ObjectDictionary,
+        network: "CanNetwork",
+        od: "canopen.ObjectDictionary",
         master_od_db: Union[dict, None] = None,
         load_core: bool = True,
     ):
@@ -74,6 +69,19 @@ class App:
             Invalid parameter(s)
         """
 
+        # imported here, so importing olaf does not pull in canopen and all the core resources
+        # pylint: disable=C0415
+        from ..canopen.master_node import MasterNode
+        from ..canopen.node import Node
+        from .resources.ecss import EcssResource
+        from .resources.fread import FreadResource
+        from .resources.fwrite import FwriteResource
+        from .resources.system import SystemResource
+        from .services.logs import LogsService
+        from .services.os_command import OsCommandService
+        from .services.updater import UpdaterService
+        from .updater import Updater
+
         self._od = od
 
         if master_od_db:
@@ -99,7 +107,7 @@ class App:
             self.add_resource(FwriteResource())
             # self.add_resource(DaemonsResource())
 
-    def add_resource(self, resource: Resource):
+    def add_resource(self, resource: "Resource"):
         """
         Add a resource for the app
 
@@ -111,7 +119,7 @@ class App:
 
         self._resources.append(resource)
 
-    def add_service(self, service: Service):
+    def add_service(self, service: "Service"):
         """
         Add a resource for the app
 
@@ -126,6 +134,8 @@ class App:
     def run(self):
         """Run the app."""
 
+        from ..canopen.node import NodeStop  # pylint: disable=C0415
+
         # setup event
         for sig in ["SIGTERM", "SIGHUP", "SIGINT"]:
             signal.signal(getattr(signal, sig), self._quit)
@@ -159,8 +169,8 @@ class App:
         if reset == NodeStop.HARD_RESET:
             logger.info("hard reseting the system")
 
-            if os.geteuid() == 0:  # running as root
-                subprocess.run("reboot", shell=True, check=False)
+            if IS_ROOT:
+                subprocess.run(["reboot"], check=False)
             else:
                 logger.error("not running as root, cannot reboot the system")
         elif reset == NodeStop.FACTORY_RESET:
@@ -178,15 +188,15 @@ class App:
             except Exception as e:  # pylint: disable=W0718
                 logger.exception(f"custom factory reset function raised: {e}")
 
-            if os.geteuid() == 0:  # running as root
-                subprocess.run("reboot", shell=True, check=False)
+            if IS_ROOT:
+                subprocess.run(["reboot"], check=False)
             else:
                 logger.error("not running as root, cannot reboot the system")
         elif reset == NodeStop.POWER_OFF:
             logger.info("powering off the system")
 
-            if os.geteuid() == 0:  # running as root
-                subprocess.run("poweroff", shell=True, check=False)
+            if IS_ROOT:
+                subprocess.run(["poweroff"], check=False)
             else:
                 logger.error("not running as root, cannot power off the system")
 
@@ -197,7 +207,7 @@ class App:
             self._node.stop()
 
     @property
-    def node(self) -> Node:
+    def node(self) -> "Node":
         """Node: The CANopen node."""
 
         return self._node
@@ -208,7 +218,7 @@ class App:
         self._factory_reset_cb = cb_func
 
     @property
-    def od(self) -> canopen.ObjectDictionary:
+    def od(self) -> "canopen.ObjectDictionary":
         """canopen.ObjectDictionary: The node's Object Dictionary."""
 
         return self._od
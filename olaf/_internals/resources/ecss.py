@@ -1,11 +1,11 @@
 """Resource for ECSS CANBus Extended Protocal standards"""
 
-from os import geteuid
 from time import CLOCK_REALTIME, clock_settime, time
 
 from loguru import logger
 
 from ...canopen.ecss import scet_int_from_time, scet_int_to_time, utc_int_from_time, utc_int_to_time
+from ...common import IS_ROOT
 from ...common.resource import Resource
 
 
@@ -41,7 +41,7 @@ class EcssResource(Resource):
     def _set_time(self, ts: float):
         """set the system time"""
 
-        if geteuid() == 0:
+        if IS_ROOT:
             clock_settime(CLOCK_REALTIME, ts)
             logger.info(f"{self.__class__.__name__} resource has set system time")
         else:
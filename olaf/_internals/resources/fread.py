@@ -19,7 +19,7 @@ class FreadResource(Resource):
         self.file_path = ""
         self.tmp_dir = "/tmp/oresat/fread"
         Path(self.tmp_dir).mkdir(parents=True, exist_ok=True)
-        logger.debug(f"fread tmp dir is {self.tmp_dir}")
+        logger.debug("fread tmp dir is {}", self.tmp_dir)
         for i in listdir(self.tmp_dir):
             remove(f"{self.tmp_dir}/{i}")
 
@@ -21,7 +21,7 @@ class FwriteResource(Resource):
 
         self.tmp_dir = "/tmp/oresat/fwrite"
         Path(self.tmp_dir).mkdir(parents=True, exist_ok=True)
-        logger.debug(f"fwrite tmp dir is {self.tmp_dir}")
+        logger.debug("fwrite tmp dir is {}", self.tmp_dir)
         for i in listdir(self.tmp_dir):
             remove(f"{self.tmp_dir}/{i}")
 
@@ -58,15 +58,14 @@ class RestAPI:
         self._thread = Thread(target=self._run)
         self._server = None
         self._ctx = None
-        Path(self._TEMPLATE_DIR).mkdir(parents=True, exist_ok=True)
-
-        # add all core templates
-        for i in os.listdir(f"{self._PATH}/templates"):
-            self.add_template(f"{self._PATH}/templates/{i}")
 
     def setup(self, address: str, port: int):
         """Setup the REST API thread"""
 
+        # add all core templates, done here and not on init to keep importing olaf free of file I/O
+        for i in os.listdir(f"{self._PATH}/templates"):
+            self.add_template(f"{self._PATH}/templates/{i}")
+
         self._server = make_server(address, port, self.app)
 
     def start(self):
@@ -99,6 +98,7 @@ class RestAPI:
             Path to the template file to add.
         """
 
+        Path(self._TEMPLATE_DIR).mkdir(parents=True, exist_ok=True)
         shutil.copy(template_path, self._TEMPLATE_DIR)
 
 
@@ -244,7 +244,7 @@ def od_index(index: str):
             value = _json_value_to_value(obj.data_type, json_value)
             raw = obj.encode_raw(value)
 
-            app.node._on_sdo_write(index, None, obj, raw)  # pylint: disable=W0212
+            app.node._on_sdo_write(obj.index, None, obj, raw)  # pylint: disable=W0212
         except Exception as e:  # pylint: disable=W0718
             logger.error(f"REST API error: {e}")
             return make_error_json(str(e))
@@ -289,7 +289,7 @@ def od_subindex(index: str, subindex: str):
             else:
                 raw = obj.encode_raw(value)
 
-            app.node._on_sdo_write(index, subindex, obj, raw)  # pylint: disable=W0212
+            app.node._on_sdo_write(obj.index, obj.subindex, obj, raw)  # pylint: disable=W0212
         except Exception as e:  # pylint: disable=W0718
             logger.exception(f"REST API error: {e}")
             return make_error_json(str(e))
@@ -335,8 +335,35 @@ def _object_to_dict(
             logger.debug("REST API error: " + msg)
             raise KeyError(msg)
 
+    return _od_obj_to_dict(obj, add_values)
+
+
+def _od_obj_to_dict(
+    obj: Union[
+        canopen.objectdictionary.Variable,
+        canopen.objectdictionary.Array,
+        canopen.objectdictionary.Record,
+    ],
+    add_values: bool = True,
+) -> dict:
+    """
+    Convert a OD object that was already looked up to a dictionary.
+
+    Parameters
+    ----------
+    obj: canopen.objectdictionary.Variable, Array, Record
+        The object to convert.
+    add_values: bool
+        Add values (current and engineering value) to dict.
+
+    Returns
+    -------
+    dict
+        The object as a dictionary.
+    """
+
     if isinstance(obj, canopen.objectdictionary.Variable):
-        value = app.node._on_sdo_read(index, subindex, obj)  # pylint: disable=W0212
+        value = app.node._on_sdo_read(obj.index, obj.subindex, obj)  # pylint: disable=W0212
         if obj.data_type in BYTES_TYPES and value is not None:
             # encode bytes data types for JSON
             try:
@@ -367,12 +394,15 @@ def _object_to_dict(
         data["unit"] = obj.unit
         data["low_limit"] = obj.min or ""
         data["high_limit"] = obj.max or ""
-    elif isinstance(obj, canopen.objectdictionary.Array):
-        data["object_type"] = "ARRAY"
-        data["subindexes"] = {sub: _object_to_dict(index, sub, add_values) for sub in obj}
     else:
-        data["object_type"] = "RECORD"
-        data["subindexes"] = {sub: _object_to_dict(index, sub, add_values) for sub in obj}
+        if isinstance(obj, canopen.objectdictionary.Array):
+            data["object_type"] = "ARRAY"
+        else:
+            data["object_type"] = "RECORD"
+        data["subindexes"] = {
+            sub: _od_obj_to_dict(sub_obj, add_values)
+            for sub, sub_obj in sorted(obj.subindices.items())
+        }
 
     return data
 
@@ -381,10 +411,10 @@ def _object_to_dict(
 def get_all_object():
     """Get all object data as a one giant JSON."""
     data = {}
-    for index in app.od:
+    for index, obj in sorted(app.od.indices.items()):
         if index < 0x3000:
             continue
-        data[index] = _object_to_dict(index, None, False)
+        data[index] = _od_obj_to_dict(obj, False)
     return data
 
 
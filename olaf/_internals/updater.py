@@ -79,12 +79,12 @@ class Updater:
         # make update_archives for cache dir
         Path(cache_dir).mkdir(parents=True, exist_ok=True)
         self._cache_dir = abspath(cache_dir)
-        logger.debug(f"updater cache dir {self._cache_dir}")
+        logger.debug("updater cache dir {}", self._cache_dir)
 
         # make update_archives for work dir
         Path(work_dir).mkdir(parents=True, exist_ok=True)
         self._work_dir = abspath(work_dir)
-        logger.debug(f"updater work dir {self._work_dir}")
+        logger.debug("updater work dir {}", self._work_dir)
 
         self._cache = OreSatFileCache(cache_dir)
 
@@ -377,7 +377,7 @@ class Updater:
             dpkg_file = new_oresat_file(keyword=DPKG_STATUS_KEYWORD)
         pip_file = "/tmp/" + new_oresat_file(keyword=PIP_STATUS_KEYWORD)
 
-        out = subprocess.run("pip freeze", capture_output=True, shell=True, check=False)
+        out = subprocess.run(["pip", "freeze"], capture_output=True, check=False)
         if out.returncode != 0:
             with open(pip_file, "w") as f:
                 f.write(out.stdout.decode("utf-8"))
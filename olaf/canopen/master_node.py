@@ -17,6 +17,8 @@ NodeHeartbeatInfo = namedtuple("NodeHeartbeatInfo", ["state", "timestamp", "time
 class MasterNode(Node):
     """OreSat CANopen Master Node (only used by the C3)"""
 
+    __slots__ = ("_od_db", "network", "_node_id_to_key", "_remote_nodes", "node_status")
+
     def __init__(
         self,
         network: CanNetwork,
@@ -166,14 +168,8 @@ class MasterNode(Node):
         """
 
         obj = self._sdo_get_obj(key, index, subindex)
-        bits = obj.od.bit_definitions[field]
-
-        value = 0
-        obj_value = obj.phys
-        for i in bits:
-            tmp = obj_value & (1 << bits[i])
-            value |= tmp >> bits[i]
-        return value
+        shift, mask = self._get_bitfield(obj.od, field)
+        return (obj.phys & mask) >> shift
 
     def sdo_read_enum(
         self, key: Any, index: Union[int, str], subindex: Union[int, str, None]
@@ -272,17 +268,8 @@ class MasterNode(Node):
         """
 
         obj = self._sdo_get_obj(key, index, subindex)
-        bits = obj.od.bit_definitions[field]
-        offset = min(bits)
-
-        mask = 0
-        for i in bits:
-            mask |= 1 << bits[i]
-
-        new_value = obj.phys
-        new_value ^= mask
-        new_value |= value << offset
-        obj.phys = new_value
+        shift, mask = self._get_bitfield(obj.od, field)
+        obj.phys = (obj.phys & ~mask) | ((value << shift) & mask)
 
     def sdo_write_enum(
         self, key: Any, index: Union[int, str], subindex: Union[int, str, None], value: str
@@ -310,8 +297,7 @@ class MasterNode(Node):
         """
 
         obj = self._sdo_get_obj(key, index, subindex)
-        tmp = {d: v for v, d in obj.od.value_descriptions}
-        obj.phys = tmp[value]
+        obj.phys = self._get_enum_values(obj.od)[value]
 
     def send_rpdo(self, rpdo: int, raise_error: bool = True):
         """
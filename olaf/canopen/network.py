@@ -1,8 +1,11 @@
 """CAN network"""
 
 import os
+import socket
+import struct
 import subprocess
 from enum import IntEnum, auto
+from time import monotonic
 from typing import Callable, Union
 
 import can
@@ -10,6 +13,60 @@ import canopen
 import psutil
 from loguru import logger
 
+from ..common import IS_ROOT
+
+# netlink constants from linux/rtnetlink.h and linux/if_link.h
+_RTMGRP_LINK = 0x1
+_RTM_NEWLINK = 16
+_RTM_DELLINK = 17
+_IFLA_IFNAME = 3
+_NLMSGHDR = struct.Struct("=IHHII")
+_IFINFOMSG_LEN = 16
+_RTATTR = struct.Struct("=HH")
+
+_IFF_UP = 0x1  # from linux/if.h
+_OPER_UP_STATES = {"up", "unknown"}  # virtual interfaces (vcan) have no operstate, so "unknown"
+_SYSFS_NET = "/sys/class/net"
+
+
+def _link_event_names(data: bytes) -> list[str]:
+    """
+    Get the interface names from the RTM_NEWLINK / RTM_DELLINK messages in a netlink datagram.
+
+    Parameters
+    ----------
+    data: bytes
+        The raw datagram read from a NETLINK_ROUTE socket.
+
+    Returns
+    -------
+    list[str]
+        The names of interfaces that changed.
+    """
+
+    names = []
+    offset = 0
+    while offset + _NLMSGHDR.size <= len(data):
+        msg_len, msg_type = _NLMSGHDR.unpack_from(data, offset)[:2]
+        if msg_len < _NLMSGHDR.size or offset + msg_len > len(data):
+            break  # malformed or truncated message
+
+        if msg_type in (_RTM_NEWLINK, _RTM_DELLINK):
+            attr_offset = offset + _NLMSGHDR.size + _IFINFOMSG_LEN
+            while attr_offset + _RTATTR.size <= offset + msg_len:
+                attr_len, attr_type = _RTATTR.unpack_from(data, attr_offset)
+                if attr_len < _RTATTR.size:
+                    break  # malformed attribute
+                if attr_type == _IFLA_IFNAME:
+                    value = data[attr_offset + _RTATTR.size : attr_offset + attr_len]
+                    names.append(value.split(b"\x00", 1)[0].decode())
+                    break
+                attr_offset += (attr_len + 3) & ~3  # attributes are 4-byte aligned
+
+        offset += (msg_len + 3) & ~3  # messages are 4-byte aligned
+
+    return names
+
 
 class CanNetworkError(Exception):
     """Error with the CANopen network / bus"""
@@ -30,6 +87,14 @@ class CanNetworkState(IntEnum):
 class CanNetwork:
     """Abstract the CAN bus. Can handle downed or missing CAN bus."""
 
+    _BUS_STATS_TTL = 1.0
+    """float: How long in seconds the CAN bus interface state is cached for."""
+    LINK_EVENTS_WATCHDOG = 30.0
+    """
+    float: How long in seconds the state is cached for when link change events are used. Callers
+    waiting on :py:attr:`link_events_fd` should still call :py:meth:`monitor` this often.
+    """
+
     def __init__(
         self,
         bus_type: str,
@@ -39,6 +104,7 @@ class CanNetwork:
     ):
         self._bus_type = bus_type
         self._channel = channel
+        self._is_socketcand = bus_type == "socketcand"  # checked every monitor tick
         self._socketcand_host = socketcand_host
         self._socketcand_port = socketcand_port
 
@@ -48,10 +114,16 @@ class CanNetwork:
         self._bus: Union[can.BusABC, None] = None
         self._network: Union[canopen.Network, None] = None
         self._notifier = None
+        self._bus_isup: Union[bool, None] = None
+        self._bus_stats_time: Union[float, None] = None
+        self._bus_flags_path = f"{_SYSFS_NET}/{channel}/flags"
+        self._bus_operstate_path = f"{_SYSFS_NET}/{channel}/operstate"
+        self._has_sysfs = os.path.isdir(_SYSFS_NET)
+        self._link_events = None if self._is_socketcand else self._open_link_events()
 
         self._state = CanNetworkState.NETWORK_INIT
 
-        if os.geteuid() != 0:  # running as root
+        if not IS_ROOT:
             logger.warning("not running as root, cannot restart CAN bus if it goes down")
 
         self._first_no_bus = True  # flag to only log error message on _first error
@@ -60,6 +132,10 @@ class CanNetwork:
     def __del__(self):
         self._del()
 
+        if self._link_events is not None:
+            self._link_events.close()
+            self._link_events = None
+
     def _init(self):
         logger.info("(re)starting CAN network")
         try:
@@ -110,27 +186,124 @@ class CanNetwork:
             self._bus.shutdown()
             self._bus = None
 
-        if os.geteuid() == 0:  # running as root
-            cmd = (
-                f"ip link set {self._channel} down;"
-                f"ip link set {self._channel} type can bitrate 1000000;"
-                f"ip link set {self._channel} up"
+        if IS_ROOT:
+            cmds = [
+                ["ip", "link", "set", self._channel, "down"],
+                ["ip", "link", "set", self._channel, "type", "can", "bitrate", "1000000"],
+                ["ip", "link", "set", self._channel, "up"],
+            ]
+            for cmd in cmds:
+                out = subprocess.run(
+                    cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+                )
+                if out.returncode != 0:
+                    logger.error(f"{' '.join(cmd)} failed: {out.stderr.strip()}")
+                    break
+
+        self._bus_stats_time = None  # bus state changed, invalidate the cached state
+
+    @staticmethod
+    def _open_link_events() -> Union[socket.socket, None]:
+        """
+        Subscribe to the kernel's network interface change events, so the CAN bus stats only have
+        to be re-read when the kernel reports a change.
+
+        Returns
+        -------
+        socket.socket | None
+            Non-blocking NETLINK_ROUTE socket or None if netlink is not available (not Linux).
+        """
+
+        try:
+            sock = socket.socket(
+                socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE  # type: ignore
             )
-            out = subprocess.run(cmd, shell=True, check=False)
-            if out.returncode != 0:
-                logger.error(out)
+        except (AttributeError, OSError) as e:
+            logger.debug("cannot subscribe to link events, polling CAN bus stats: {}", e)
+            return None
+
+        try:
+            sock.bind((0, _RTMGRP_LINK))
+            sock.setblocking(False)
+        except OSError as e:
+            logger.debug("cannot subscribe to link events, polling CAN bus stats: {}", e)
+            sock.close()
+            return None
+
+        return sock
+
+    def _link_changed(self) -> bool:
+        """Read all pending link change events. Returns True if any were for the CAN channel."""
+
+        changed = False
+        while True:
+            try:
+                data = self._link_events.recv(65536)  # type: ignore
+            except BlockingIOError:
+                break  # no more events
+            except OSError:
+                changed = True  # event queue overflowed (ENOBUFS), events were lost
+                break
+            if self._channel in _link_event_names(data):
+                changed = True
+        return changed
+
+    def _read_bus_isup(self) -> Union[bool, None]:
+        """
+        Read if the CAN bus interface is up.
+
+        Up means running, like psutil's isup (IFF_RUNNING); administratively up and the link is
+        up, so a CAN interface that is bus-off is down. IFF_RUNNING is not in the sysfs flags, so
+        it is made the same way the kernel does, from IFF_UP and the operstate. Falls back to
+        psutil (which enumerates every interface) when there is no sysfs (not Linux).
+
+        Returns
+        -------
+        bool | None
+            True if the interface is up, False if down, or None if it does not exist.
+        """
+
+        if self._has_sysfs:
+            try:
+                with open(self._bus_flags_path, "r", encoding="ascii") as f:
+                    if not int(f.read(), 16) & _IFF_UP:
+                        return False
+                with open(self._bus_operstate_path, "r", encoding="ascii") as f:
+                    return f.read().strip() in _OPER_UP_STATES
+            except FileNotFoundError:
+                return None
+
+        stats = psutil.net_if_stats().get(self._channel)
+        return None if stats is None else stats.isup
+
+    def _get_bus_isup(self) -> Union[bool, None]:
+        """Get if the CAN bus interface is up, only re-read when the cached state is stale."""
+
+        now = monotonic()
+        if self._link_events is not None:
+            # kernel pushes link changes, so only re-read on a change (or the rare watchdog)
+            stale = self._link_changed()
+            ttl = self.LINK_EVENTS_WATCHDOG
+        else:
+            stale = False
+            ttl = self._BUS_STATS_TTL
+
+        if stale or self._bus_stats_time is None or now - self._bus_stats_time >= ttl:
+            self._bus_isup = self._read_bus_isup()
+            self._bus_stats_time = now
+        return self._bus_isup
 
     def monitor(self):
         """Monitor the CAN bus/network"""
 
-        if self._bus_type == "socketcand":
+        if self._is_socketcand:
             if self._state != CanNetworkState.NETWORK_UP:
                 self._init()
                 self._state = CanNetworkState.NETWORK_UP
             return
 
-        bus = psutil.net_if_stats().get(self._channel)
-        bus_exist = bus is not None
+        bus_isup = self._get_bus_isup()
+        bus_exist = bus_isup is not None
 
         if self._state == CanNetworkState.NETWORK_INIT:
             self._init()
@@ -149,7 +322,7 @@ class CanNetwork:
                 self._first_no_bus = True  # reset flag
                 self._del()
                 self._state = CanNetworkState.NETWORK_NO_BUS
-            elif not bus.isup:
+            elif not bus_isup:
                 self._del()
                 self._restart_bus()
             else:
@@ -160,7 +333,7 @@ class CanNetwork:
                 self._first_no_bus = True  # reset flag
                 self._del()
                 self._state = CanNetworkState.NETWORK_NO_BUS
-            elif not bus.isup:
+            elif not bus_isup:
                 self._first_bus_down = True  # reset flag
                 self._del()
                 self._state = CanNetworkState.NETWORK_DOWN
@@ -199,6 +372,17 @@ class CanNetwork:
         if self._network is not None:
             self._network.add_node(node)
 
+    @property
+    def link_events_fd(self) -> Union[int, None]:
+        """
+        int | None: File descriptor that becomes readable when the kernel reports a link change,
+        only while the network is up. When None, :py:meth:`monitor` must be polled.
+        """
+
+        if self._link_events is None or self._state != CanNetworkState.NETWORK_UP:
+            return None
+        return self._link_events.fileno()
+
     @property
     def channel(self) -> str:
         """str: The CAN channel."""
@@ -1,12 +1,13 @@
 """OreSat CANopen Node"""
 
+import heapq
 import os
-import struct
+import select
 from enum import IntEnum
 from pathlib import Path
 from threading import Event
 from time import monotonic
-from typing import Any, Callable, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from canopen import LocalNode, ObjectDictionary
 from canopen.objectdictionary import (
@@ -19,12 +20,34 @@ from canopen.objectdictionary import (
     ODRecord,
     ODVariable,
 )
+from canopen.sdo import SdoVariable
 from loguru import logger
 
 from ..canopen.network import CanNetwork, CanNetworkState
+from ..common import IS_ROOT
 from ..common.daemon import Daemon
 from ..common.oresat_file_cache import OreSatFileCache
 from . import EmcyCode
+from .pdo import (
+    PdoEntry,
+    PdoPlan,
+    build_pdo_plan,
+    get_tpdo_comms,
+    make_sync_buckets,
+    make_tpdo_schedule,
+)
+
+_PDO_LEN_EXCEEDED = EmcyCode.PROTOCOL_PDO_LEN_EXCEEDED.value
+"""int: EMCY code sent when the objects mapped into a PDO are longer than 8 bytes."""
+
+_INTEGER_TYPES = frozenset(INTEGER_TYPES)
+"""frozenset[int]: canopen's INTEGER_TYPES tuple as a set, for quick membership tests."""
+
+_FLOAT_TYPES = frozenset(FLOAT_TYPES)
+"""frozenset[int]: canopen's FLOAT_TYPES tuple as a set, for quick membership tests."""
+
+_BINARY_DATA_TYPES = {DOMAIN, OCTET_STRING}
+"""set[int]: OD data types that are stored as raw bytes."""
 
 
 class NodeStop(IntEnum):
@@ -61,6 +84,37 @@ class Node:
     basic API for CANopen things.
     """
 
+    __slots__ = (
+        "_event",
+        "_wake_r",
+        "_wake_w",
+        "_od",
+        "_node",
+        "_network",
+        "_read_cbs",
+        "_write_cbs",
+        "_syncs",
+        "_reset",
+        "_daemons",
+        "_pdo_plans",
+        "_pdo_entries",
+        "_tpdo_schedule_changed",
+        "_sync_buckets",
+        "_pdo_generation",
+        "_bitfield_cache",
+        "_enum_cache",
+        "_tpdo_comms",
+        "_heartbeat_obj",
+        "_err_reg_obj",
+        "work_base_dir",
+        "cache_base_dir",
+        "_fread_cache",
+        "_fwrite_cache",
+        "_start_time",
+        "_first_network_reset",
+        "_rpdo_cobid_to_num",
+    )
+
     def __init__(self, network: CanNetwork, od: ObjectDictionary):
         """
         Parameters
@@ -72,16 +126,34 @@ class Node:
         """
 
         self._event = Event()
+        # self-pipe to wake the run loop, as it also waits on the network's link events
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
         self._od = od
         self._node: LocalNode = None
         self._network: CanNetwork = network
-        self._read_cbs = {}  # type: ignore
-        self._write_cbs = {}  # type: ignore
+        self._read_cbs: dict[tuple[int, Optional[int]], Callable[[], Any]] = {}
+        self._write_cbs: dict[tuple[int, Optional[int]], Callable[[Any], None]] = {}
         self._syncs = 0
         self._reset = NodeStop.SOFT_RESET
         self._daemons = {}  # type: ignore
-
-        if os.geteuid() == 0:  # running as root
+        self._pdo_plans: dict[int, Optional[PdoPlan]] = {}  # None for a mapping that is too long
+        self._pdo_entries: dict[tuple[int, int], PdoEntry] = {}
+        self._tpdo_schedule_changed = True
+        self._sync_buckets: Union[dict[int, list[int]], None] = None
+        # bumped on every invalidate, a plan / buckets built across one is not stored
+        self._pdo_generation = 0
+        self._bitfield_cache: dict[tuple[int, str], tuple[int, int]] = {}
+        self._enum_cache: dict[int, dict[str, int]] = {}
+
+        # the OD objects never move, so look up the ones used on every SYNC / tick / EMCY once
+        indices = self._od.indices
+        self._tpdo_comms = get_tpdo_comms(self._od)
+        self._heartbeat_obj: ODVariable = indices[0x1017]
+        self._err_reg_obj: ODVariable = indices[0x1001]
+
+        if IS_ROOT:
             self.work_base_dir = "/var/lib/oresat"
             self.cache_base_dir = "/var/cache/oresat"
         else:
@@ -94,8 +166,8 @@ class Node:
         self._fread_cache = OreSatFileCache(fread_path)
         self._fwrite_cache = OreSatFileCache(fwrite_path)
 
-        logger.debug(f"fread cache path {self._fread_cache.dir}")
-        logger.debug(f"fwrite cache path {self._fwrite_cache.dir}")
+        logger.debug("fread cache path {}", self._fread_cache.dir)
+        logger.debug("fwrite cache path {}", self._fwrite_cache.dir)
 
         self._start_time = monotonic()
         self._network.monitor()
@@ -105,7 +177,7 @@ class Node:
 
         self._rpdo_cobid_to_num: dict[int, int] = {}
         for i in range(self._od.device_information.nr_of_RXPDO):
-            cob_id = self._od[0x1400 + i][1].value
+            cob_id = indices[0x1400 + i][1].value
             self._rpdo_cobid_to_num[cob_id] = i
             self._network.subscribe(cob_id, self._on_pdo)
 
@@ -114,6 +186,9 @@ class Node:
         if not self._event.is_set():
             self.stop()
 
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
     def _on_sync(self, cob_id: int, data: bytes, timestamp: float):  # pylint: disable=W0613
         """On SYNC message send TPDOs configured to be SYNC-based"""
 
@@ -121,28 +196,43 @@ class Node:
         if self._syncs == 241:
             self._syncs = 1
 
-        for i in range(self.od.device_information.nr_of_TXPDO):
-            transmission_type = self.od[0x1800 + i][2].value
+        if self._node is None or self._node.nmt.state != "OPERATIONAL":
+            return
+
+        # read once, od_write() from another thread can invalidate it at any time
+        buckets = self._sync_buckets
+        if buckets is None:
+            generation = self._pdo_generation
+            buckets = make_sync_buckets(self._tpdo_comms)
+            if generation == self._pdo_generation:
+                self._sync_buckets = buckets
+
+        due_tpdos: list[int] = []
+        for transmission_type, tpdos in buckets.items():
             if self._syncs % transmission_type == 0:
-                self.send_tpdo(i)
+                due_tpdos += tpdos
+        if due_tpdos:
+            self._send_tpdos(due_tpdos)
 
     def _on_pdo(self, cob_id: int, data: bytes, timestamp: float):  # pylint: disable=W0613
         rpdo = self._rpdo_cobid_to_num[cob_id]
-        maps = self.od[0x1600 + rpdo][0].value
+        indices = self._od.indices
+        map_record = indices[0x1600 + rpdo]
+        maps = map_record[0].value
 
         offset = 0
         for i in range(maps):
-            pdo_map = self.od[0x1600 + rpdo][i + 1].value
+            pdo_map = map_record[i + 1].value
 
             if pdo_map == 0:
                 break  # nothing todo
 
-            pdo_map_bytes = pdo_map.to_bytes(4, "big")
-            index, subindex, size = struct.unpack(">HBB", pdo_map_bytes)
-            size //= 8
+            index = pdo_map >> 16
+            subindex = (pdo_map >> 8) & 0xFF
+            size = (pdo_map & 0xFF) // 8
 
             # call sdo callback(s) and convert data to bytes
-            if isinstance(self.od[index], ODVariable):
+            if type(indices[index]) is ODVariable:  # pylint: disable=C0123
                 self._node.sdo[index].raw = data[offset : offset + size]
             else:  # record or array
                 self._node.sdo[index][subindex].raw = data[offset : offset + size]
@@ -162,6 +252,8 @@ class Node:
         self._node.add_read_callback(self._on_sdo_read)
         self._node.add_write_callback(self._on_sdo_write)
 
+        self._build_tpdo_plans()
+
         if not self._first_network_reset or monotonic() - self._start_time > 5:
             self.send_emcy(0x8140)
         else:
@@ -185,47 +277,125 @@ class Node:
 
         logger.info(f"{self.name} node is starting")
 
-        loops = -1
-        delay_ms = 100
-        delay = delay_ms / 1000
-        start_time = monotonic()
+        delay = 0.1  # monitor poll period when the network cannot push link changes
+        next_monitor = monotonic()
+        next_heartbeat = next_monitor
+        tpdo_schedule: list[tuple[float, float, int]] = []
         while not self._event.is_set():
-            loops += 1
-            self._event.wait(delay - ((monotonic() - start_time) % delay))
-            self._network.monitor()
-
-            if self._network.status != CanNetworkState.NETWORK_UP:
-                continue
-
-            # send heartbeat
-            event_time = self.od[0x1017].value
-            if loops % (event_time // delay_ms) == 0:
+            if self._tpdo_schedule_changed:
+                self._tpdo_schedule_changed = False
+                # TPDOs whose period did not change keep their phase
+                tpdo_schedule = make_tpdo_schedule(self._tpdo_comms, monotonic(), tpdo_schedule)
+
+            # a producer heartbeat time of 0 disables it
+            heartbeat_period = self._heartbeat_obj.value / 1000
+            network_up = self._network.status == CanNetworkState.NETWORK_UP
+
+            # sleep until the next monitor tick, heartbeat, or timer-based TPDO, whichever is
+            # sooner, or until the kernel reports a link change
+            now = monotonic()
+            timeout = next_monitor - now
+            if heartbeat_period and network_up:
+                timeout = min(timeout, next_heartbeat - now)
+            if tpdo_schedule:
+                timeout = min(timeout, tpdo_schedule[0][0] - now)
+            link_changed = self._wait(max(timeout, 0.0))
+            if self._event.is_set():
+                break  # stop() was called while waiting
+
+            now = monotonic()
+            if link_changed or now >= next_monitor:
+                self._network.monitor()
+                if self._network.link_events_fd is None:
+                    period = delay
+                else:
+                    period = self._network.LINK_EVENTS_WATCHDOG
+                next_monitor += period
+                if link_changed or next_monitor <= now:
+                    next_monitor = now + period
+                network_up = self._network.status == CanNetworkState.NETWORK_UP
+
+            if heartbeat_period and network_up and now >= next_heartbeat:
                 self._network.send_message(0x700 + self.od.node_id, b"\x05", False)
-
-            # send all timer-based TPDOs
-            for i in range(self._od.device_information.nr_of_TXPDO):
-                if i + 0x1800 not in self.od:
-                    continue
-                transmission_type = self.od[0x1800 + i][2].value
-                event_time = self.od[0x1800 + i][5].value
-                if (
-                    transmission_type in [0xFE, 0xFF]
-                    and event_time != 0
-                    and loops % (event_time // delay_ms) == 0
-                ):
-                    self.send_tpdo(i + 1)
+                next_heartbeat += heartbeat_period
+                if next_heartbeat <= now:
+                    next_heartbeat = now + heartbeat_period
+
+            # send all timer-based TPDOs that are due
+            due_tpdos = []
+            while tpdo_schedule and tpdo_schedule[0][0] <= now:
+                deadline, period, tpdo = heapq.heappop(tpdo_schedule)
+                due_tpdos.append(tpdo)
+                deadline += period
+                if deadline <= now:
+                    deadline = now + period  # fell behind (e.g. network was down), don't burst
+                heapq.heappush(tpdo_schedule, (deadline, period, tpdo))
+            if due_tpdos and network_up:
+                self._send_tpdos(due_tpdos)
 
         self._destroy_node()
 
         logger.info(f"{self.name} node has ended")
         return self._reset
 
+    def _wait(self, timeout: float) -> bool:
+        """
+        Sleep until the timeout, stop() / _wake() is called, or the network has a link change.
+
+        Parameters
+        ----------
+        timeout: float
+            Max time to sleep in seconds.
+
+        Returns
+        -------
+        bool
+            True if the network reported a link change.
+        """
+
+        link_events_fd = self._network.link_events_fd
+        fds = [self._wake_r] if link_events_fd is None else [self._wake_r, link_events_fd]
+        readable = select.select(fds, [], [], timeout)[0]
+        if self._wake_r in readable:
+            try:
+                os.read(self._wake_r, 4096)
+            except BlockingIOError:
+                pass
+        return link_events_fd is not None and link_events_fd in readable
+
+    def _wake(self):
+        """Wake the run loop, so it sees a stop or a changed heartbeat / TPDO timing."""
+
+        try:
+            os.write(self._wake_w, b"\x00")
+        except BlockingIOError:
+            pass  # pipe is full, the run loop will wake anyways
+
+    def _invalidate_pdo_plans(self, index: Optional[int] = None):
+        """
+        A PDO communication or mapping parameter was changed, drop anything derived from them.
+
+        Parameters
+        ----------
+        index: int | None
+            The index that was changed or None for all. The SYNC groups and timer schedule only
+            depend on the TPDO parameters, so they are left alone for a RPDO parameter change.
+        """
+
+        self._pdo_generation += 1
+        self._pdo_plans.clear()
+        if index is None or 0x1800 <= index < 0x1C00:
+            self._sync_buckets = None
+            self._tpdo_schedule_changed = True
+            self._wake()
+
     def stop(self, reset: Union[NodeStop, None] = None):
         """End the run loop"""
 
         if reset is not None:
             self._reset = reset
         self._event.set()
+        self._wake()
 
     def add_daemon(self, name: str):
         """Add a daemon for the node to monitor and/or control"""
@@ -234,9 +404,9 @@ class Node:
 
     def add_sdo_callbacks(
         self,
-        index: str,
-        subindex: str,
-        read_cb: Callable[[None], Any],
+        index: Union[int, str],
+        subindex: Union[int, str, None],
+        read_cb: Callable[[], Any],
         write_cb: Callable[[Any], None],
     ):
         """
@@ -248,7 +418,7 @@ class Node:
             The index to call the callback on.
         subindex: int or str
             The subindex to call the callback on.
-        read_cb: Callable[[None], Any]
+        read_cb: Callable[[], Any]
             The SDO read callback. Allows overriding the data being sent on a SDO read. If
             overriding read data return the value or return :py:data:`None` to use the the value
             from the od. Set to :py:data:`None` for no read_cb.
@@ -259,62 +429,153 @@ class Node:
         """
 
         try:
-            self.od[index]
+            obj = self.od[index]
         except KeyError:
             logger.warning(f"index {index} does not exist, ignoring request for new sdo callback")
             return
 
-        if subindex:
+        # callbacks are keyed by the ints the SDO server calls back with (a subindex of 0 is valid
+        # for records and arrays), variables are keyed with no subindex, see _on_sdo_read()
+        if subindex is not None and not isinstance(obj, ODVariable):
             try:
-                self.od[index][subindex]
+                obj = obj[subindex]
             except KeyError:
                 logger.warning(
                     f"subindex {subindex} for index {index} does not exist, ignoring request for "
                     "new sdo callback"
                 )
                 return
-
+            key = (obj.index, obj.subindex)
+        else:
+            key = (obj.index, None)
         if read_cb is not None:
-            self._read_cbs[index, subindex] = read_cb
+            self._read_cbs[key] = read_cb
         if write_cb is not None:
-            self._write_cbs[index, subindex] = write_cb
+            self._write_cbs[key] = write_cb
 
-    def _send_pdo(self, comm_index: int, map_index: int, raise_error: bool = True):
-        """Send a PDO. Will not be sent if not node is not in operational state."""
+    def _get_pdo_entry(self, index: int, subindex: int) -> PdoEntry:
+        """
+        Get the SDO variable and encode function for a mapped object. The entries are shared by
+        all PDOs, so objects mapped into multiple PDOs are only resolved once.
+        """
 
-        # PDOs should not be sent if CANopen node not in 'OPERATIONAL' state
-        if self._node.nmt.state != "OPERATIONAL":
-            return
+        entry = self._pdo_entries.get((index, subindex))
+        if entry is None:
+            if type(self.od[index]) is ODVariable:  # pylint: disable=C0123
+                entry = (self._node.sdo[index], self.od[index].encode_raw)
+            else:  # record or array
+                entry = (self._node.sdo[index][subindex], self.od[index][subindex].encode_raw)
+            self._pdo_entries[index, subindex] = entry
+        return entry
 
-        cob_id = self.od[comm_index][1].value & 0x3F_FF_FF_FF
-        maps = self.od[map_index][0].value
+    def _build_tpdo_plans(self):
+        """
+        (Re)build the plans for all TPDOs of a new CANopen node, so the first send of each TPDO
+        does not have to decode the mapping.
+        """
 
-        data = b""
-        for i in range(maps):
-            pdo_map = self.od[map_index][i + 1].value
+        # plans reference the old node's SDO objects
+        self._pdo_plans.clear()
+        self._pdo_entries.clear()
 
-            if pdo_map == 0:
-                break  # nothing todo
+        indices = self._od.indices
+        for i in range(self._od.device_information.nr_of_TXPDO):
+            if 0x1800 + i not in indices or 0x1A00 + i not in indices:
+                continue
+            if indices[0x1800 + i][1].value & 0x80_00_00_00:
+                continue  # TPDO is disabled, its mapping may not be valid, so leave it to send
+            self._pdo_plans[0x1800 + i] = self._make_pdo_plan(0x1800 + i, 0x1A00 + i)
 
-            pdo_map_bytes = pdo_map.to_bytes(4, "big")
-            index, subindex, _ = struct.unpack(">HBB", pdo_map_bytes)
+    def _make_pdo_plan(self, comm_index: int, map_index: int) -> Optional[PdoPlan]:
+        """
+        Build a PDO's plan. If the PDO does not exist, the mapping is too long (reported once with
+        an EMCY), or it maps an object that is not in the OD, log it and return None, the PDO is
+        not sent until the mapping is changed.
+        """
 
-            # call sdo callback(s) and convert data to bytes
-            if isinstance(self.od[index], ODVariable):
-                value = self._node.sdo[index].phys
-                value_bytes = self.od[index].encode_raw(value)
-            else:  # record or array
-                value = self._node.sdo[index][subindex].phys
-                value_bytes = self.od[index][subindex].encode_raw(value)
+        indices = self._od.indices
+        if comm_index not in indices or map_index not in indices:
+            logger.error(f"there is no PDO at 0x{comm_index:04X} / 0x{map_index:04X}")
+            return None
 
-            # pack pdo with bytes
-            data += value_bytes
+        try:
+            return build_pdo_plan(self._od, comm_index, map_index, self._get_pdo_entry)
+        except ValueError as e:
+            logger.error(e)
+            self._send_emcy_raw(_PDO_LEN_EXCEEDED, b"", False)
+        except KeyError as e:
+            logger.error(f"PDO mapping 0x{map_index:04X} maps a missing object: {e}")
+        return None
+
+    def _send_pdo(
+        self,
+        comm_index: int,
+        map_index: int,
+        raise_error: bool = True,
+        encoded_cache: Union[Dict[SdoVariable, bytes], None] = None,
+    ):
+        """
+        Send a PDO. Will not be sent if not node is not in operational state.
+
+        If encoded_cache is set, the encoded value of each mapped object is looked up in / added to
+        it, so PDOs sent together that map the same objects only read and encode them once.
+        """
 
-        if len(data) > 8:
-            self.send_emcy(EmcyCode.PROTOCOL_PDO_LEN_EXCEEDED, b"", False)
+        # PDOs should not be sent if there is no CANopen node (network is down) or it is not in
+        # 'OPERATIONAL' state
+        if self._node is None or self._node.nmt.state != "OPERATIONAL":
             return
 
-        self._network.send_message(cob_id, data, raise_error)
+        try:
+            pdo_plan = self._pdo_plans[comm_index]
+        except KeyError:
+            generation = self._pdo_generation
+            pdo_plan = self._make_pdo_plan(comm_index, map_index)
+            if generation == self._pdo_generation:
+                self._pdo_plans[comm_index] = pdo_plan  # else it may be stale, build it again
+        if pdo_plan is None:
+            return  # mapping is too long or invalid
+        cob_id, sdo_vars, encoders, check_len = pdo_plan
+
+        # call sdo callback(s), convert data to bytes, and pack pdo with bytes
+        # a new bytearray is used, as python-can keeps a bytearray as is instead of copying it
+        # (PDOs are sent from multiple threads, so a buffer cannot be shared)
+        data = bytearray()
+        if encoded_cache is None:
+            for sdo_var, encode in zip(sdo_vars, encoders):
+                data += encode(sdo_var.phys)
+        else:
+            for sdo_var, encode in zip(sdo_vars, encoders):
+                value_bytes = encoded_cache.get(sdo_var)
+                if value_bytes is None:
+                    value_bytes = encode(sdo_var.phys)
+                    encoded_cache[sdo_var] = value_bytes
+                data += value_bytes
+
+        if check_len and len(data) > 8:  # a variable-length object is too long
+            self._send_emcy_raw(_PDO_LEN_EXCEEDED, b"", False)
+        else:
+            self._network.send_message(cob_id, data, raise_error)
+
+    def _send_tpdos(self, tpdos: list[int], raise_error: bool = True):
+        """
+        Send multiple TPDOs that are due at the same time. Objects mapped into more than one of
+        them are only read and encoded once.
+
+        Every TPDO send goes through this; send_tpdo(), the timer-based ones, and the SYNC-based
+        ones. Override it to control all of them.
+
+        Parameters
+        ----------
+        tpdos: list[int]
+            TPDO numbers to send, should be between 1 and 16.
+        raise_error: bool
+            Set to False to not raise NetworkError.
+        """
+
+        encoded_cache: Dict[SdoVariable, bytes] = {}
+        for tpdo in tpdos:
+            self._send_pdo(0x1800 + tpdo - 1, 0x1A00 + tpdo - 1, raise_error, encoded_cache)
 
     def send_tpdo(self, tpdo: int, raise_error: bool = True):
         """
@@ -329,16 +590,21 @@ class Node:
 
         Raises
         ------
+        ValueError
+            Invalid tpdo number, or the OD has no such TPDO.
         NetworkError
             Cannot send a TPDO message when the network is down.
         """
         if tpdo < 1:
             raise ValueError("TPDO number must be greater than 1")
 
-        tpdo -= 1  # number to offset
-        comm_index = 0x1800 + tpdo
-        map_index = 0x1A00 + tpdo
-        self._send_pdo(comm_index, map_index, raise_error)
+        comm_index = 0x1800 + tpdo - 1
+        map_index = 0x1A00 + tpdo - 1
+        indices = self._od.indices
+        if comm_index not in indices or map_index not in indices:
+            raise ValueError(f"TPDO {tpdo} does not exist")
+
+        self._send_tpdos([tpdo], raise_error)
 
     def send_emcy(self, code: Union[EmcyCode, int], data: bytes = b"", raise_error: bool = True):
         """
@@ -365,8 +631,14 @@ class Node:
         if len(data) > 5:
             raise ValueError("data must be 5 or less bytes")
 
-        frame = code.to_bytes(2, "little") + self.od[0x1001].value.to_bytes(1, "little") + data
-        frame += b"\x00" * (5 - len(data))
+        self._send_emcy_raw(code, data, raise_error)
+
+    def _send_emcy_raw(self, code: int, data: bytes, raise_error: bool):
+        """Send a EMCY message, without any checks on the args. For internal callers."""
+
+        frame = b"".join(
+            [code.to_bytes(2, "little"), self._err_reg_obj.value.to_bytes(1, "little"), data]
+        ).ljust(8, b"\x00")
         self._network.send_message(self.od.node_id + 0x80, frame, raise_error)
         logger.error(f"sent emcy 0x{code:04X} {data.hex()}")
 
@@ -393,16 +665,12 @@ class Node:
 
         ret = None
 
-        # convert any ints to strs
-        if isinstance(self.od[index], ODVariable) and od == self.od[index]:
-            index = od.name
+        if type(self._od.indices[index]) is ODVariable:  # pylint: disable=C0123
             subindex = None  # type: ignore
-        else:
-            index = self.od[index].name
-            subindex = od.name
 
-        if (index, subindex) in self._read_cbs:
-            ret = self._read_cbs[index, subindex]()
+        read_cb = self._read_cbs.get((index, subindex))
+        if read_cb is not None:
+            ret = read_cb()
 
         # get value from OD
         if ret is None:
@@ -428,24 +696,23 @@ class Node:
             The raw data being written.
         """
 
-        binary_types = [DOMAIN, OCTET_STRING]
-
         # set value in OD before callback
-        if od.data_type in binary_types:
+        if od.data_type in _BINARY_DATA_TYPES:
             od.value = data
         else:
             od.value = od.decode_raw(data)
 
-        # convert any ints to strs
-        if isinstance(self.od[index], ODVariable) and od == self.od[index]:
-            index = od.name
+        if 0x1400 <= index < 0x1C00:
+            self._invalidate_pdo_plans(index)
+        elif index == 0x1017:
+            self._wake()  # heartbeat time changed
+
+        if type(self._od.indices[index]) is ODVariable:  # pylint: disable=C0123
             subindex = None  # type: ignore
-        else:
-            index = self.od[index].name
-            subindex = od.name
 
-        if (index, subindex) in self._write_cbs:
-            self._write_cbs[index, subindex](od.value)
+        write_cb = self._write_cbs.get((index, subindex))
+        if write_cb is not None:
+            write_cb(od.value)
 
     @property
     def bus(self) -> str:
@@ -553,13 +820,59 @@ class Node:
         """
 
         obj = self.od_get_obj(index, subindex)
-        bits = obj.bit_definitions[field]
+        shift, mask = self._get_bitfield(obj, field)
+        return (obj.value & mask) >> shift
+
+    def _get_bitfield(self, obj: ODVariable, field: str) -> tuple[int, int]:
+        """
+        Get the shift and mask for a bit field of an object. They are only computed on first use.
+
+        Parameters
+        ----------
+        obj: ODVariable
+            The object with the bit field.
+        field: str
+            Name of the bit field.
+
+        Returns
+        -------
+        int
+            The offset of the field's lowest bit.
+        int
+            The mask of all the field's bits.
+        """
 
-        value = 0
-        for i in bits:
-            tmp = obj.value & (1 << bits[i])
-            value |= tmp >> bits[i]
-        return value
+        key = (id(obj), field)
+        bitfield = self._bitfield_cache.get(key)
+        if bitfield is None:
+            bits = obj.bit_definitions[field]
+            mask = 0
+            for bit in bits:
+                mask |= 1 << bit
+            bitfield = (min(bits), mask)
+            self._bitfield_cache[key] = bitfield
+        return bitfield
+
+    def _get_enum_values(self, obj: ODVariable) -> dict[str, int]:
+        """
+        Get the enum str to value map of an object. It is only built on first use.
+
+        Parameters
+        ----------
+        obj: ODVariable
+            The object with the value descriptions.
+
+        Returns
+        -------
+        dict[str, int]
+            The value for each enum str.
+        """
+
+        values = self._enum_cache.get(id(obj))
+        if values is None:
+            values = {d: v for v, d in obj.value_descriptions.items()}
+            self._enum_cache[id(obj)] = values
+        return values
 
     def od_read_enum(self, index: Union[int, str], subindex: Union[int, str, None]) -> str:
         """
@@ -588,16 +901,17 @@ class Node:
         def make_error_value(data_type) -> str:
             return f"cannot write {value!r} ({data_type}) to object {obj.name} ({obj.data_type})"
 
-        if obj.data_type in INTEGER_TYPES:
+        if obj.data_type in _INTEGER_TYPES:
             if value_type != int:
                 raise TypeError(make_error_value("int"))
             if obj.max is not None and value > obj.max:
                 raise ValueError(f"value {value!r} too high (high limit {obj.max})")
             if obj.min is not None and value < obj.min:
                 raise ValueError(f"value {value!r} too low (low limit {obj.min})")
-        elif obj.data_type in FLOAT_TYPES:
-            if not isinstance(value, int):
+        elif obj.data_type in _FLOAT_TYPES:
+            if value_type not in (int, float):
                 raise TypeError(make_error_value("float"))
+            value = float(value)  # so it is read back as a float
             if obj.max is not None and value > obj.max:
                 raise ValueError(f"value {value!r} too high (high limit {obj.max})")
             if obj.min is not None and value < obj.min:
@@ -636,6 +950,11 @@ class Node:
         obj = self.od_get_obj(index, subindex)
         self._var_write(obj, value)
 
+        if 0x1400 <= obj.index < 0x1C00:
+            self._invalidate_pdo_plans(obj.index)
+        elif obj.index == 0x1017:
+            self._wake()  # heartbeat time changed
+
     def od_write_bitfield(
         self, index: Union[int, str], subindex: Union[int, str, None], field: str, value: int
     ):
@@ -660,17 +979,8 @@ class Node:
         """
 
         obj = self.od_get_obj(index, subindex)
-        bits = obj.bit_definitions[field]
-        offset = min(bits)
-
-        mask = 0
-        for i in bits:
-            mask |= 1 << bits[i]
-
-        new_value = obj.value
-        new_value ^= mask
-        new_value |= value << offset
-        obj.value = new_value
+        shift, mask = self._get_bitfield(obj, field)
+        obj.value = (obj.value & ~mask) | ((value << shift) & mask)
 
     def od_write_enum(self, index: Union[int, str], subindex: Union[int, str, None], value: str):
         """
@@ -687,5 +997,4 @@ class Node:
         """
 
         obj = self.od_get_obj(index, subindex)
-        tmp = {d: v for v, d in obj.value_descriptions}
-        obj.value = tmp[value.lower()]
+        obj.value = self._get_enum_values(obj)[value.lower()]
@@ -0,0 +1,191 @@
+"""
+PDO helpers for the OreSat CANopen Node; decoded PDO mappings (plans), SYNC-based TPDO groups, and
+the timer-based TPDO schedule, so none of them have to be worked out on every send.
+"""
+
+import heapq
+from typing import Any, Callable, Optional
+
+from canopen import ObjectDictionary
+from canopen.objectdictionary import ODRecord, ODVariable
+from canopen.sdo import SdoVariable
+
+PdoEntry = tuple[SdoVariable, Callable[[Any], bytes]]
+"""The SDO variable and encode function of a object mapped into a PDO."""
+
+PdoPlan = tuple[int, tuple[SdoVariable, ...], tuple[Callable[[Any], bytes], ...], bool]
+"""
+A PDO's COB-ID, the SDO variables and encode functions of the mapped objects (in order), and if the
+encoded length must be checked on every send (a mapped object is variable-length).
+"""
+
+SYNC_TRANSMISSION_TYPES = range(1, 241)
+"""range: TPDO transmission types that are sent every nth SYNC (cyclic synchronous)."""
+
+EVENT_TRANSMISSION_TYPES = {0xFE, 0xFF}
+"""set[int]: TPDO transmission types that are event-driven (sent on the event timer)."""
+
+
+def get_tpdo_comms(od: ObjectDictionary) -> list[tuple[int, ODRecord]]:
+    """
+    Get all TPDO communication parameter records in the OD.
+
+    Parameters
+    ----------
+    od: ObjectDictionary
+        The OD to get the records from.
+
+    Returns
+    -------
+    list[tuple[int, ODRecord]]
+        The TPDO number and its communication parameter record.
+    """
+
+    indices = od.indices
+    tpdo_comms = []
+    for i in range(od.device_information.nr_of_TXPDO):
+        comm_record = indices.get(0x1800 + i)
+        if comm_record is not None:
+            tpdo_comms.append((i + 1, comm_record))
+    return tpdo_comms
+
+
+def make_tpdo_schedule(
+    tpdo_comms: list[tuple[int, ODRecord]],
+    start: float,
+    old_schedule: Optional[list[tuple[float, float, int]]] = None,
+) -> list[tuple[float, float, int]]:
+    """
+    Make the schedule for all timer-based TPDOs.
+
+    Parameters
+    ----------
+    tpdo_comms: list[tuple[int, ODRecord]]
+        The TPDO numbers and communication parameter records, see get_tpdo_comms().
+    start: float
+        The monotonic time new TPDOs, or ones with a changed period, are first sent at.
+    old_schedule: list[tuple[float, float, int]] | None
+        The schedule being replaced, TPDOs in it whose period did not change keep their next send
+        time.
+
+    Returns
+    -------
+    list[tuple[float, float, int]]
+        Heap of the next send time, the period in seconds, and the TPDO number.
+    """
+
+    old = {tpdo: (deadline, period) for deadline, period, tpdo in old_schedule or []}
+
+    schedule = []
+    for tpdo, comm_record in tpdo_comms:
+        transmission_type = comm_record[2].value
+        event_time = comm_record[5].value
+        if transmission_type in EVENT_TRANSMISSION_TYPES and event_time != 0:
+            period = event_time / 1000
+            deadline, old_period = old.get(tpdo, (start, period))
+            schedule.append((deadline if old_period == period else start, period, tpdo))
+    heapq.heapify(schedule)
+    return schedule
+
+
+def make_sync_buckets(tpdo_comms: list[tuple[int, ODRecord]]) -> dict[int, list[int]]:
+    """
+    Group the SYNC-based TPDOs by transmission type.
+
+    Parameters
+    ----------
+    tpdo_comms: list[tuple[int, ODRecord]]
+        The TPDO numbers and communication parameter records, see get_tpdo_comms().
+
+    Returns
+    -------
+    dict[int, list[int]]
+        The TPDO numbers for each transmission type (send every nth SYNC) in use.
+    """
+
+    buckets: dict[int, list[int]] = {}
+    for tpdo, comm_record in tpdo_comms:
+        transmission_type = comm_record[2].value
+        if transmission_type in SYNC_TRANSMISSION_TYPES:
+            buckets.setdefault(transmission_type, []).append(tpdo)
+    return buckets
+
+
+def build_pdo_plan(
+    od: ObjectDictionary,
+    comm_index: int,
+    map_index: int,
+    get_entry: Callable[[int, int], PdoEntry],
+) -> PdoPlan:
+    """
+    Decode a PDO's COB-ID and mapping once, so it does not have to be done on every send.
+
+    Parameters
+    ----------
+    od: ObjectDictionary
+        The OD with the PDO.
+    comm_index: int
+        The index of the PDO's communication parameter record.
+    map_index: int
+        The index of the PDO's mapping parameter record.
+    get_entry: Callable[[int, int], PdoEntry]
+        Gets the SDO variable and encode function for a mapped object's index and subindex.
+
+    Raises
+    ------
+    ValueError
+        The mapping is longer than 64 bits or the fixed-size mapped objects are longer than 8
+        bytes.
+    KeyError
+        A mapped object is not in the OD.
+
+    Returns
+    -------
+    int
+        The COB-ID of the PDO.
+    tuple[SdoVariable, ...]
+        The SDO variable of each mapped object, in PDO order.
+    tuple[Callable[[Any], bytes], ...]
+        The encode function of each mapped object, in PDO order.
+    bool
+        True if a mapped object is variable-length (e.g. a string or domain), so the length of the
+        encoded data can only be checked when it is sent.
+    """
+
+    indices = od.indices
+    cob_id = indices[comm_index][1].value & 0x3F_FF_FF_FF
+    map_record = indices[map_index]
+    maps = map_record[0].value
+
+    entries = []
+    bits = 0
+    for i in range(maps):
+        pdo_map = map_record[i + 1].value
+
+        if pdo_map == 0:
+            break  # nothing todo
+
+        index = pdo_map >> 16
+        subindex = (pdo_map >> 8) & 0xFF
+        bits += pdo_map & 0xFF
+        entries.append(get_entry(index, subindex))
+
+    if bits > 64:
+        raise ValueError(f"PDO mapping 0x{map_index:04X} is {bits} bits, max is 64 bits")
+
+    sdo_vars = tuple(entry[0] for entry in entries)
+    encoders = tuple(entry[1] for entry in entries)
+
+    # the encoded length of fixed-size objects is known now, so only check it once
+    size = 0
+    check_len = False
+    for sdo_var in sdo_vars:
+        struct_type = ODVariable.STRUCT_TYPES.get(sdo_var.od.data_type)
+        if struct_type is None:
+            check_len = True
+        else:
+            size += struct_type.size
+    if size > 8:
+        raise ValueError(f"PDO mapping 0x{map_index:04X} is {size} bytes, max is 8 bytes")
+
+    return cob_id, sdo_vars, encoders, check_len
@@ -1,7 +1,11 @@
 """Common OLAF class and functions."""
 
+import os
 import re
 
+IS_ROOT = os.geteuid() == 0
+"""bool: Is the process running as root. The effective user cannot change while running."""
+
 
 def natsorted(data: list[str], ignore_case: bool = False) -> list[str]:
     """
@@ -35,24 +35,24 @@ class Daemon:
     def start(self):
         """Start the daemon."""
 
-        subprocess.run(f"systemctl start {self._name}", shell=True, check=False)
+        subprocess.run(["systemctl", "start", self._name], check=False)
 
     def stop(self):
         """Stop the daemon."""
 
-        subprocess.run(f"systemctl stop {self._name}", shell=True, check=False)
+        subprocess.run(["systemctl", "stop", self._name], check=False)
 
     def restart(self):
         """Restart the daemon."""
 
-        subprocess.run(f"systemctl restart {self._name}", shell=True, check=False)
+        subprocess.run(["systemctl", "restart", self._name], check=False)
 
     @property
     def status(self) -> DaemonState:
         """DaemonState: The state of the daemon."""
 
-        cmd = f"systemctl status {self._name}"
-        out = subprocess.run(cmd, capture_output=True, shell=True, check=False)
+        cmd = ["systemctl", "status", self._name]
+        out = subprocess.run(cmd, capture_output=True, check=False)
         reply = out.stdout.decode()
         line = reply.split("\n")[2].strip()
         state = line.split(" ")[1]
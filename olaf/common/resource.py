@@ -21,7 +21,7 @@ class Resource:
         App will call this to start the resource. This will call `self.on_start()`.
         """
 
-        logger.debug(f"starting resource {self.__class__.__name__}")
+        logger.debug("starting resource {}", self.__class__.__name__)
         self.node = node
 
         try:
@@ -36,7 +36,7 @@ class Resource:
         App will call this to stop the resource. This will call `self.on_end()`.
         """
 
-        logger.debug(f"stopping resource {self.__class__.__name__}")
+        logger.debug("stopping resource {}", self.__class__.__name__)
 
         try:
             self.on_end()
@@ -53,7 +53,7 @@ class Service:
         """
 
         self._status = ServiceState.STARTING
-        logger.debug(f"starting service {self.__class__.__name__}")
+        logger.debug("starting service {}", self.__class__.__name__)
         self.node = node
 
         try:
@@ -113,7 +113,7 @@ class Service:
         """
 
         self._status = ServiceState.STOPPING
-        logger.debug(f"stopping service {self.__class__.__name__}")
+        logger.debug("stopping service {}", self.__class__.__name__)
 
         try:
             self.on_stop_before()
@@ -0,0 +1,122 @@
+"""Test the CAN network's link state parsing."""
+
+import struct
+import tempfile
+import unittest
+from os.path import join
+
+from olaf.canopen.network import CanNetwork, _link_event_names
+
+RTM_NEWLINK = 16
+RTM_DELLINK = 17
+RTM_NEWADDR = 20
+IFLA_MTU = 4
+IFLA_IFNAME = 3
+
+
+def rtattr(attr_type: int, value: bytes) -> bytes:
+    """Pack a netlink route attribute, padded to 4 bytes."""
+
+    attr = struct.pack("=HH", 4 + len(value), attr_type) + value
+    return attr + b"\x00" * (-len(attr) % 4)
+
+
+def nlmsg(msg_type: int, *attrs: bytes) -> bytes:
+    """Pack a netlink message with a ifinfomsg header and the attributes, padded to 4 bytes."""
+
+    body = bytes(16) + b"".join(attrs)  # ifinfomsg is 16 bytes, its content is not parsed
+    msg = struct.pack("=IHHII", 16 + len(body), msg_type, 0, 0, 0) + body
+    return msg + b"\x00" * (-len(msg) % 4)
+
+
+class TestLinkEventNames(unittest.TestCase):
+    """Test getting the interface names from netlink link messages."""
+
+    def test_single(self):
+        """A new link and a deleted link message are both link events."""
+
+        data = nlmsg(RTM_NEWLINK, rtattr(IFLA_IFNAME, b"can0\x00"))
+        self.assertListEqual(_link_event_names(data), ["can0"])
+
+        data = nlmsg(RTM_DELLINK, rtattr(IFLA_IFNAME, b"vcan0\x00"))
+        self.assertListEqual(_link_event_names(data), ["vcan0"])
+
+    def test_multiple(self):
+        """All link messages in a datagram are parsed, other message types are skipped."""
+
+        data = (
+            nlmsg(RTM_NEWLINK, rtattr(IFLA_IFNAME, b"can0\x00"))
+            + nlmsg(RTM_NEWADDR, rtattr(IFLA_IFNAME, b"eth0\x00"))
+            + nlmsg(RTM_DELLINK, rtattr(IFLA_IFNAME, b"can1\x00"))
+        )
+        self.assertListEqual(_link_event_names(data), ["can0", "can1"])
+
+    def test_alignment(self):
+        """Attributes with lengths that are not a multiple of 4 are padded before the next one."""
+
+        # 4 + 5 = 9 byte attribute, padded to 12
+        data = nlmsg(RTM_NEWLINK, rtattr(99, b"abcde"), rtattr(IFLA_IFNAME, b"can0\x00"))
+        self.assertListEqual(_link_event_names(data), ["can0"])
+
+        # an odd length name is padded before the next message
+        data = nlmsg(RTM_NEWLINK, rtattr(IFLA_IFNAME, b"can10\x00")) + nlmsg(
+            RTM_NEWLINK, rtattr(IFLA_MTU, struct.pack("=I", 16)), rtattr(IFLA_IFNAME, b"can2\x00")
+        )
+        self.assertListEqual(_link_event_names(data), ["can10", "can2"])
+
+    def test_no_name(self):
+        """A link message without a IFLA_IFNAME attribute has no name."""
+
+        data = nlmsg(RTM_NEWLINK, rtattr(IFLA_MTU, struct.pack("=I", 16)))
+        self.assertListEqual(_link_event_names(data), [])
+
+    def test_malformed(self):
+        """Truncated or malformed input must not raise or loop forever."""
+
+        data = nlmsg(RTM_NEWLINK, rtattr(IFLA_IFNAME, b"can0\x00"))
+
+        self.assertListEqual(_link_event_names(b""), [])
+        self.assertListEqual(_link_event_names(data[:10]), [])  # truncated header
+
+        # message length is smaller than the header
+        bad_len = struct.pack("=I", 4) + data[4:]
+        self.assertListEqual(_link_event_names(bad_len), [])
+
+        # attribute length is smaller than the attribute header
+        bad_attr = data[:32] + struct.pack("=HH", 2, IFLA_IFNAME) + data[36:]
+        self.assertListEqual(_link_event_names(bad_attr), [])
+
+        # attribute is cut off at the end of the datagram, but its header says it is longer
+        truncated = data[:-4]
+        self.assertListEqual(_link_event_names(truncated), [])
+
+        # a valid message after a malformed one is not parsed, the offsets cannot be trusted
+        self.assertListEqual(_link_event_names(bad_len + data), [])
+
+
+class TestBusIsUp(unittest.TestCase):
+    """Test reading if the bus interface is up (running) from sysfs."""
+
+    def test_read_bus_isup(self):
+        """The interface must be administratively up and have its link up, like IFF_RUNNING."""
+
+        network = CanNetwork("socketcan", "can0")
+        network._has_sysfs = True
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            network._bus_flags_path = join(tmp_dir, "flags")
+            network._bus_operstate_path = join(tmp_dir, "operstate")
+
+            self.assertIsNone(network._read_bus_isup())  # interface does not exist
+
+            for flags, operstate, isup in [
+                ("0x80", "down", False),  # administratively down
+                ("0x81", "up", True),
+                ("0x81", "unknown", True),  # vcan has no operstate
+                ("0x81", "down", False),  # up, but no carrier (e.g. bus-off)
+                ("0x81", "lowerlayerdown", False),
+            ]:
+                with open(network._bus_flags_path, "w", encoding="ascii") as f:
+                    f.write(flags + "\n")
+                with open(network._bus_operstate_path, "w", encoding="ascii") as f:
+                    f.write(operstate + "\n")
+                self.assertEqual(network._read_bus_isup(), isup, (flags, operstate))
@@ -0,0 +1,209 @@
+"""Test the Node class."""
+
+import unittest
+
+from canopen import ObjectDictionary
+from oresat_configs import Mission, OreSatConfig
+
+from olaf import CanNetwork, Node
+
+
+class RacyNode(Node):
+    """Node with a PDO parameter write on another thread while every PDO plan is being built."""
+
+    __slots__ = ()
+
+    def _make_pdo_plan(self, comm_index: int, map_index: int):
+        plan = super()._make_pdo_plan(comm_index, map_index)
+        self._invalidate_pdo_plans()  # what od_write() does
+        return plan
+
+
+class RecordingNode(Node):
+    """Node that records the TPDOs it would send, instead of sending them."""
+
+    def __init__(self, network: CanNetwork, od: ObjectDictionary):
+        self.sent: list[list[int]] = []
+        super().__init__(network, od)
+
+    def _send_tpdos(self, tpdos: list[int], raise_error: bool = True):
+        self.sent.append(tpdos)
+
+
+class TestNode(unittest.TestCase):
+    """Test the Node class."""
+
+    def setUp(self):
+        self.od = OreSatConfig(Mission.default()).od_db["gps"]
+        self.network = CanNetwork("virtual", "vcan0")
+
+    def test_invalid_tpdo_mapping(self):
+        """A TPDO mapping a missing object must not stop the node from being made."""
+
+        self.od[0x1806][1].value |= 0x80_00_00_00  # disabled
+        self.od[0x1806][2].value = 0
+        self.od[0x1A06][0].value = 1
+        self.od[0x1A06][1].value = 0x5F_FF_00_08  # there is no 0x5FFF
+
+        node = Node(self.network, self.od)
+        node._setup_node()  # what a network (re)start does, this used to raise a KeyError
+
+        # enabled, the PDO is not sent, but it does not raise either
+        self.od[0x1806][1].value &= ~0x80_00_00_00
+        node._invalidate_pdo_plans()
+        node.send_tpdo(7)
+        self.assertIsNone(node._pdo_plans[0x1806])
+
+    def test_bitfield(self):
+        """Multi-bit fields are read and written without touching the other fields."""
+
+        node = Node(self.network, self.od)
+
+        node.od_write("device_type", None, 0x1234_5678)
+        self.assertEqual(node.od_read_bitfield("device_type", None, "additional_info"), 0x1234)
+        self.assertEqual(node.od_read_bitfield("device_type", None, "device_profile_numer"), 0x5678)
+
+        # writing a field clears its old bits, it does not xor them
+        node.od_write_bitfield("device_type", None, "additional_info", 0xABCD)
+        self.assertEqual(node.od_read("device_type", None), 0xABCD_5678)
+        node.od_write_bitfield("device_type", None, "device_profile_numer", 0x00F0)
+        self.assertEqual(node.od_read("device_type", None), 0xABCD_00F0)
+
+        # values too big for the field are truncated to it
+        node.od_write_bitfield("device_type", None, "device_profile_numer", 0x1_0001)
+        self.assertEqual(node.od_read("device_type", None), 0xABCD_0001)
+
+        # a multi-bit field next to single bit fields
+        node.od_write("cob_id_sync", None, 1 << 30)
+        node.od_write_bitfield("cob_id_sync", None, "can_id", 0x7FF)
+        self.assertEqual(node.od_read("cob_id_sync", None), (1 << 30) | 0x7FF)
+        self.assertEqual(node.od_read_bitfield("cob_id_sync", None, "can_id"), 0x7FF)
+        self.assertEqual(node.od_read_bitfield("cob_id_sync", None, "gen"), 1)
+        self.assertEqual(node.od_read_bitfield("cob_id_sync", None, "frame"), 0)
+
+    def test_sdo_callbacks(self):
+        """SDO callbacks are called for variables and for subindex 0 of records."""
+
+        node = Node(self.network, self.od)
+        record = self.od["system"]
+
+        node.add_sdo_callbacks("system", 0, lambda: 42, None)
+        self.assertEqual(node._on_sdo_read(record.index, 0, record[0]), 42)
+
+        node.add_sdo_callbacks("device_type", None, lambda: 7, None)
+        self.assertEqual(node._on_sdo_read(0x1000, 0, self.od[0x1000]), 7)
+
+    def test_enum(self):
+        """Enum strs written to the OD are read back, all the values of the enum work."""
+
+        node = Node(self.network, self.od)
+
+        for index, subindex in [("skytraq", "fix_mode"), ("satellite_id", None)]:
+            obj = node.od_get_obj(index, subindex)
+            for value, name in obj.value_descriptions.items():
+                node.od_write_enum(index, subindex, name)
+                self.assertEqual(obj.value, value)
+                self.assertEqual(node.od_read_enum(index, subindex), name)
+
+        node.od_write_enum("skytraq", "fix_mode", "3D")  # not case sensitive
+        self.assertEqual(node.od_read_enum("skytraq", "fix_mode"), "3d")
+
+        with self.assertRaises(KeyError):
+            node.od_write_enum("skytraq", "fix_mode", "not_a_fix_mode")
+
+    def test_float(self):
+        """A int can be written to a float object, like any other number, and is read as a float."""
+
+        od = OreSatConfig(Mission.default()).od_db["c3"]  # the gps card has no float objects
+        node = Node(self.network, od)
+
+        node.od_write("adcs_manager", "orbital_period", 5400)
+        value = node.od_read("adcs_manager", "orbital_period")
+        self.assertIsInstance(value, float)
+        self.assertEqual(value, 5400.0)
+
+        node.od_write("adcs_manager", "orbital_period", 5400.5)
+        self.assertEqual(node.od_read("adcs_manager", "orbital_period"), 5400.5)
+
+        for value in ["5400", True]:
+            with self.assertRaises(TypeError):
+                node.od_write("adcs_manager", "orbital_period", value)
+
+    def test_pdo_plan_invalidated_while_building(self):
+        """A plan built across an invalidate is not stored, it may be from the old parameters."""
+
+        node = RacyNode(self.network, self.od)
+        node._setup_node()
+        node._invalidate_pdo_plans()
+
+        node.send_tpdo(1, False)
+        self.assertNotIn(0x1800, node._pdo_plans)
+
+    def test_send_missing_tpdo(self):
+        """Sending a TPDO the OD does not have is an error, like a TPDO number less than 1."""
+
+        node = Node(self.network, self.od)
+        node._setup_node()
+
+        nr_of_tpdos = self.od.device_information.nr_of_TXPDO
+        with self.assertRaises(ValueError):
+            node.send_tpdo(nr_of_tpdos + 1, False)
+        with self.assertRaises(ValueError):
+            node.send_tpdo(0, False)
+
+    def test_send_tpdos_override(self):
+        """Overriding _send_tpdos() controls all TPDO sends, the direct and SYNC-based ones."""
+
+        self.od[0x1800][2].value = 1  # every SYNC
+        node = RecordingNode(self.network, self.od)
+        node._setup_node()
+
+        node.send_tpdo(2)
+        node._on_sync(0x80, b"", 0.0)
+        self.assertListEqual(node.sent, [[2], [1]])
+
+    def test_rpdo_write_keeps_tpdo_timing(self):
+        """Only TPDO parameter writes make the TPDO schedule and SYNC groups be remade."""
+
+        node = Node(self.network, self.od)
+        node._tpdo_schedule_changed = False
+        node._sync_buckets = {}
+
+        node.od_write(0x1400, 2, 0xFE)
+        self.assertFalse(node._tpdo_schedule_changed)
+        self.assertIsNotNone(node._sync_buckets)
+
+        node.od_write(0x1800, 5, 500)
+        self.assertTrue(node._tpdo_schedule_changed)
+        self.assertIsNone(node._sync_buckets)
+
+    def test_pdo_length(self):
+        """Fixed-size mappings are checked once, variable-length ones on every send."""
+
+        node = Node(self.network, self.od)
+        node._setup_node()
+
+        sent = []
+        self.network.send_message = lambda cob_id, data, raise_error=True: sent.append(cob_id)
+
+        # 3 x UINT32 with made up 8-bit map lengths, too long even though the bits fit
+        self.od[0x1A06][0].value = 3
+        for i in range(3):
+            self.od[0x1A06][i + 1].value = 0x1000_0008
+        node._invalidate_pdo_plans()
+        node.send_tpdo(7)
+        self.assertIsNone(node._pdo_plans[0x1806])
+        self.assertListEqual(sent, [0x80 + self.od.node_id])  # the EMCY
+
+        # a VISIBLE_STRING is checked when sent
+        self.od[0x1A06][0].value = 1
+        self.od[0x1A06][1].value = 0x3007_0240
+        node._invalidate_pdo_plans()
+        sent.clear()
+        node.od_write(0x3007, 2, "12345678")
+        node.send_tpdo(7)
+        self.assertListEqual(sent, [self.od[0x1806][1].value & 0x7FF])
+        sent.clear()
+        node.od_write(0x3007, 2, "123456789")
+        node.send_tpdo(7)
+        self.assertListEqual(sent, [0x80 + self.od.node_id])  # the EMCY, not the TPDO
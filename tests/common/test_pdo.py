@@ -0,0 +1,38 @@
+"""Test the PDO helpers."""
+
+import unittest
+
+from oresat_configs import Mission, OreSatConfig
+
+from olaf.canopen.pdo import get_tpdo_comms, make_tpdo_schedule
+
+
+class TestTpdoSchedule(unittest.TestCase):
+    """Test the timer-based TPDO schedule."""
+
+    def setUp(self):
+        self.od = OreSatConfig(Mission.default()).od_db["gps"]
+        for i in range(2):
+            self.od[0x1800 + i][2].value = 0xFE  # event-driven
+            self.od[0x1800 + i][5].value = 1000  # every second
+        self.tpdo_comms = get_tpdo_comms(self.od)[:2]
+
+    def test_make(self):
+        """All timer-based TPDOs start at the start time."""
+
+        schedule = make_tpdo_schedule(self.tpdo_comms, 10.0)
+        self.assertListEqual(sorted(schedule), [(10.0, 1.0, 1), (10.0, 1.0, 2)])
+
+    def test_remake_keeps_phase(self):
+        """Only TPDOs whose period changed restart, the rest keep their next send time."""
+
+        old = [(10.5, 1.0, 1), (10.7, 1.0, 2)]
+        self.od[0x1801][5].value = 2000
+
+        schedule = make_tpdo_schedule(self.tpdo_comms, 11.0, old)
+        self.assertListEqual(sorted(schedule), [(10.5, 1.0, 1), (11.0, 2.0, 2)])
+
+        # no longer timer-based
+        self.od[0x1800][2].value = 1
+        schedule = make_tpdo_schedule(self.tpdo_comms, 11.0, old)
+        self.assertListEqual(sorted(schedule), [(11.0, 2.0, 2)])
@@ -0,0 +1,229 @@
+"""Mock node and app base shared by the resource and service tests."""
+
+import atexit
+import logging
+import os
+import shutil
+import tempfile
+from copy import deepcopy
+from functools import cache, lru_cache
+from typing import Any, Iterable, Iterator, Optional, Union
+
+import canopen
+
+from olaf import OreSatFileCache, logger
+from olaf.canopen.network import CanNetwork
+from olaf.canopen.node import Node, NodeStop
+
+# no sinks, so log calls return before doing any work (disable() still inspects the caller)
+logger.remove()
+logging.disable(logging.CRITICAL)  # also silence stdlib logging from libraries (python-can)
+
+_DOMAIN = canopen.objectdictionary.DOMAIN
+
+
+@cache
+def _gps_od() -> canopen.ObjectDictionary:
+    """Get the GPS card's OD, only made on the first call. Copy it before use, nodes write to it."""
+
+    # oresat_configs is slow to import and build, so only pay for it once a node is made
+    from oresat_configs import Mission, OreSatConfig  # pylint: disable=C0415
+
+    return OreSatConfig(Mission.default()).od_db["gps"]
+
+
+def _od_variables(od: canopen.ObjectDictionary) -> Iterator[canopen.objectdictionary.ODVariable]:
+    """Get all variables in the OD, including the ones in records and arrays."""
+
+    for obj in od.values():
+        if isinstance(obj, canopen.objectdictionary.ODVariable):
+            yield obj
+        else:
+            yield from obj.values()
+
+
+def _flat_od(
+    od: canopen.ObjectDictionary,
+) -> dict[tuple[Union[int, str], Optional[Union[int, str]]], canopen.objectdictionary.ODVariable]:
+    """Get a flat (index, subindex) -> variable map of the OD, with both the int and str keys."""
+
+    od_flat: dict[
+        tuple[Union[int, str], Optional[Union[int, str]]], canopen.objectdictionary.ODVariable
+    ] = {}
+    for obj in od.values():
+        if isinstance(obj, canopen.objectdictionary.ODVariable):
+            for index in (obj.index, obj.name):
+                od_flat[index, None] = obj
+            continue
+        for sub_obj in obj.values():
+            for index in (obj.index, obj.name):
+                for subindex in (sub_obj.subindex, sub_obj.name):
+                    od_flat[index, subindex] = sub_obj
+    return od_flat
+
+
+class MockNode(Node):
+    """Mock node for testing resources and services."""
+
+    __slots__ = ("_od_flat", "_sdo_flat", "_defaults", "_cache_dir")
+
+    _instance = None
+    """MockNode: The node shared by all MockApps, see get_or_create()."""
+
+    def __init__(self):
+        od = deepcopy(_gps_od())
+        network = CanNetwork("virtual", "vcan0")
+        self._od_flat = _flat_od(od)  # before Node.__init__(), it can call _setup_node()
+        super().__init__(network, od)
+
+        self._make_file_caches()
+        self._setup_node()
+
+        # snapshot the OD, so the node can be reset to it between tests
+        self._defaults = [(obj, obj.value) for obj in _od_variables(od)]
+
+    @classmethod
+    def get_or_create(cls) -> "MockNode":
+        """Get the node shared by all tests, it is only made on the first call."""
+
+        if cls._instance is None:
+            cls._instance = cls()
+            atexit.register(cls._instance.cleanup)
+        return cls._instance
+
+    def _setup_node(self):
+        super()._setup_node()
+
+        # only the SDO objects are new, the OD walk is done once in __init__()
+        sdo = self._node.sdo
+        self._sdo_flat = {
+            key: sdo[obj.index] if key[1] is None else sdo[obj.index][obj.subindex]
+            for key, obj in self._od_flat.items()
+        }
+        # clear after the swap, so a test thread cannot re-cache an old SDO object in between
+        _resolve.cache_clear()
+
+    def _make_file_caches(self):
+        # fresh dirs, so there is nothing to clear and tests cannot share files; both caches are
+        # under one temp dir, so there is only one dir to make and remove
+        self._cache_dir = tempfile.mkdtemp(prefix="olaf_test_")
+        self._fread_cache = OreSatFileCache(os.path.join(self._cache_dir, "fread"))
+        self._fwrite_cache = OreSatFileCache(os.path.join(self._cache_dir, "fwrite"))
+
+    def _send_tpdos(self, tpdos: list[int], raise_error: bool = True):
+        pass  # override to do nothing, all TPDO sends go through this
+
+    def cleanup(self):
+        """Remove the file cache dirs."""
+
+        shutil.rmtree(self._cache_dir, ignore_errors=True)
+
+    def reset(self):
+        """Reset the node to how it was made; OD values, SDO callbacks, and file caches."""
+
+        for obj, value in self._defaults:
+            obj.value = value
+        self._node.data_store.clear()
+        self._read_cbs.clear()
+        self._write_cbs.clear()
+        self._daemons.clear()
+        self._invalidate_pdo_plans()
+        # a resource / service under test may have stopped the node
+        self._event.clear()
+        self._reset = NodeStop.SOFT_RESET
+        self._syncs = 0
+
+        self.cleanup()
+        self._make_file_caches()
+
+
+@lru_cache(maxsize=None)
+def _resolve(
+    node: MockNode, index: Union[int, str], subindex: Optional[Union[int, str]]
+) -> Optional[tuple[canopen.objectdictionary.ODVariable, canopen.sdo.SdoVariable, bool]]:
+    """
+    Get the OD object, the SDO object, and if it is a DOMAIN, only resolved once per key.
+
+    Returns None if there is no object at the key; misses are cached too, so tests looping over
+    bad keys do not look them up again.
+
+    lru_cache is thread-safe and the flat maps are only ever replaced, never changed in place, so
+    this is single-writer (MockNode._setup_node(), on the CAN network thread) and multi-reader.
+    """
+
+    key = (index, subindex)
+    obj = node._od_flat.get(key)
+    if obj is None:
+        return None
+    return obj, node._sdo_flat[key], obj.data_type == _DOMAIN
+
+
+def _resolve_or_raise(
+    node: MockNode, index: Union[int, str], subindex: Optional[Union[int, str]]
+) -> tuple[canopen.objectdictionary.ODVariable, canopen.sdo.SdoVariable, bool]:
+    """Same as _resolve(), but raises KeyError, like the SDO objects do, on a miss."""
+
+    resolved = _resolve(node, index, subindex)
+    if resolved is None:
+        raise KeyError(f"no object at index {index!r}, subindex {subindex!r}")
+    return resolved
+
+
+class BaseMockApp:
+    """Base for the mock apps for testing resources and services, has the node and SDO helpers."""
+
+    __slots__ = ("node",)
+
+    reuse_node = True
+    """
+    bool: Use the shared MockNode, reset between tests. Set to False on the class (instances have
+    no __dict__) for a new node per test.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+        self.node = MockNode.get_or_create() if self.reuse_node else MockNode()
+
+    def sdo_read(self, index: Union[int, str], subindex: Optional[Union[int, str]]) -> Any:
+        """Call a internal SDO read for testing"""
+
+        _, entry, is_domain = _resolve_or_raise(self.node, index, subindex)
+        return entry.raw if is_domain else entry.phys
+
+    def sdo_write(self, index: Union[int, str], subindex: Optional[Union[int, str]], value):
+        """Call a internal SDO write for testing"""
+
+        _, entry, is_domain = _resolve_or_raise(self.node, index, subindex)
+        if is_domain:
+            entry.raw = value
+        else:
+            entry.phys = value
+
+    def sdo_write_many(
+        self, items: Iterable[tuple[Union[int, str], Optional[Union[int, str]], Any]]
+    ):
+        """
+        Call internal SDO writes for testing, in order; all keys are resolved before the first
+        write, so a bad key writes nothing.
+        """
+
+        writes = [
+            (_resolve_or_raise(self.node, index, subindex), value)
+            for index, subindex, value in items
+        ]
+        for (_, entry, is_domain), value in writes:
+            if is_domain:
+                entry.raw = value
+            else:
+                entry.phys = value
+
+    def _stop_node(self):
+        """Stop the mocked node, after the resource / service was stopped."""
+
+        if self.reuse_node:
+            self.node.reset()  # the node is shared, so reset it instead of stopping it
+        else:
+            self.node._destroy_node()
+            self.node.stop()
+            self.node.cleanup()
@@ -0,0 +1,47 @@
+"""Test the mock app helpers used by the resource and service tests."""
+
+import unittest
+
+from .mocks import BaseMockApp
+
+
+class TestMockApp(unittest.TestCase):
+    """Test the mock app SDO helpers."""
+
+    def setUp(self):
+        self.app = BaseMockApp()
+
+    def tearDown(self):
+        self.app._stop_node()
+
+    def test_sdo_write_many(self):
+        """Writes are done in order, a later write to the same object wins."""
+
+        self.app.sdo_write_many(
+            [
+                (0x1017, None, 0.5),
+                ("skytraq", "number_of_sv", 3),
+                ("producer_heartbeat_time", None, 0.25),
+                ("skytraq", 2, 4),
+            ]
+        )
+        self.assertEqual(self.app.sdo_read(0x1017, None), 0.25)
+        self.assertEqual(self.app.sdo_read("skytraq", "number_of_sv"), 4)
+
+    def test_sdo_write_many_bad_key(self):
+        """A bad key raises before anything is written."""
+
+        heartbeat = self.app.sdo_read(0x1017, None)
+        number_of_sv = self.app.sdo_read("skytraq", "number_of_sv")
+
+        with self.assertRaises(KeyError):
+            self.app.sdo_write_many(
+                [
+                    (0x1017, None, heartbeat + 0.5),
+                    ("skytraq", "not_a_subindex", 1),
+                    ("skytraq", "number_of_sv", number_of_sv + 1),
+                ]
+            )
+
+        self.assertEqual(self.app.sdo_read(0x1017, None), heartbeat)
+        self.assertEqual(self.app.sdo_read("skytraq", "number_of_sv"), number_of_sv)